@@ -1,10 +1,12 @@
 from __future__ import annotations
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 import json
 import os
 from pathlib import Path
 import sys
-from typing import Any, List, Optional, Union, Iterator
+from typing import Any, Iterable, List, Mapping, Optional, Union, Iterator
 import yaml
 
 from linkml_runtime.dumpers import json_dumper
@@ -29,6 +31,7 @@ from modos.helpers.schema import (
     dict_to_instance,
     ElementType,
     set_data_path,
+    check_haspart_relationship,
     set_haspart_relationship,
     UserElementType,
     update_haspart_id,
@@ -39,6 +42,9 @@ from modos.genomics.region import Region
 from modos.io import extract_metadata, parse_attributes
 from modos.remote import EndpointManager, is_s3_path
 
+# Maximum number of concurrent data file copies when adding elements
+MAX_TRANSFER_WORKERS = 8
+
 
 class MODO:
     """Multi-Omics Digital Object
@@ -308,6 +314,40 @@ class MODO:
             element, source_file, part_of, allowed_elements=UserElementType
         )
 
+    def add_elements(
+        self,
+        elements: Iterable[
+            tuple[
+                model.DataEntity
+                | model.Sample
+                | model.Assay
+                | model.ReferenceGenome,
+                Mapping[str, Any],
+            ]
+        ],
+    ):
+        """Add multiple elements to the archive at once.
+        Data files are copied concurrently and the metadata is only
+        consolidated once all elements have been added.
+
+        Parameters
+        ----------
+        elements
+            Pairs of element and keyword arguments (source_file and
+            part_of) as accepted by add_element.
+        """
+        batch = []
+        for element, args in elements:
+            unknown = set(args) - {"source_file", "part_of"}
+            if unknown:
+                raise TypeError(
+                    f"Unexpected arguments for element {element.id}: {sorted(unknown)}"
+                )
+            batch.append(
+                (element, args.get("source_file"), args.get("part_of"))
+            )
+        self._add_any_elements(batch, allowed_elements=UserElementType)
+
     def _add_any_element(
         self,
         element: (
@@ -322,51 +362,109 @@ class MODO:
         allowed_elements: type = ElementType,
     ):
         """Add an element of any type to the storage. This is meant to be called internally to add elements automatically."""
-        # Check that ID does not exist in modo
-        if element.id in [Path(id).name for id in self.metadata.keys()]:
-            raise ValueError(
-                f"Please specify a unique ID. Element with ID {element.id} already exist."
-            )
-
-        # Copy data file to storage and update data_path in metadata
-        if source_file:
-            source_path = Path(source_file)
-            target_path = Path(element._get("data_path"))
-            self.storage.put(source_path, target_path)
+        self._add_any_elements(
+            [(element, source_file, part_of)],
+            allowed_elements=allowed_elements,
+        )
 
-            # Genomic files have an associated index file
-            try:
-                ft = GenomicFileSuffix.from_path(source_path)
-                source_ix = source_path.with_suffix(
-                    source_path.suffix + ft.get_index_suffix()
-                )
-                target_ix = target_path.with_suffix(
-                    source_path.suffix + ft.get_index_suffix()
+    def _add_any_elements(
+        self,
+        elements: List[tuple[Any, Optional[Path], Optional[str]]],
+        allowed_elements: type = ElementType,
+    ):
+        """Add a batch of (element, source_file, part_of) to the storage."""
+        # Check that IDs do not exist in modo, nor twice in the batch
+        ids = {Path(id).name for id in self.metadata.keys()}
+        for element, _, _ in elements:
+            if element.id in ids:
+                raise ValueError(
+                    f"Please specify a unique ID. Element with ID {element.id} already exist."
                 )
-                self.storage.put(source_ix, target_ix)
-            except ValueError:
-                pass
+            ids.add(element.id)
 
-        # Inferred from type inferred from type
-        type_name = allowed_elements.from_object(element).value
-        type_group = self.zarr[type_name]
-        element_path = f"{type_name}/{element.id}"
+        # Check parents before writing anything, so that a failed add
+        # leaves no partial elements. Parents may be part of the batch.
+        batch_types = {
+            f"{allowed_elements.from_object(element).value}/{element.id}": (
+                element.__class__.__name__
+            )
+            for element, _, _ in elements
+        }
+        for element, _, part_of in elements:
+            if part_of is None:
+                continue
+            type_name = allowed_elements.from_object(element).value
+            parent_path = part_of.strip("/")
+            if parent_path in batch_types:
+                parent_type = batch_types[parent_path]
+            else:
+                parent_type = self.zarr[parent_path].attrs.get("@type")
+            check_haspart_relationship(
+                element.__class__.__name__,
+                f"{type_name}/{element.id}",
+                parent_type,
+                f"/{parent_path}",
+            )
 
-        if part_of is not None:
-            partof_group = self.zarr[part_of]
+        # Copy data files to storage (I/O bound -> threads)
+        transfers = [
+            transfer
+            for element, source_file, _ in elements
+            if source_file
+            for transfer in self._get_data_transfers(element, source_file)
+        ]
+        if len(transfers) > 1:
+            with ThreadPoolExecutor(max_workers=MAX_TRANSFER_WORKERS) as ex:
+                list(ex.map(lambda t: self.storage.put(*t), transfers))
+        elif transfers:
+            self.storage.put(*transfers[0])
+
+        # Group children by parent, parents may be part of the batch
+        children = defaultdict(list)
+        for element, _, part_of in elements:
+            type_name = allowed_elements.from_object(element).value
+            if part_of is not None:
+                child_key = (part_of, element.__class__.__name__)
+                children[child_key].append(f"{type_name}/{element.id}")
+
+            # Update haspart relationship
+            element = update_haspart_id(element)
+
+            # Add element to metadata
+            attrs = json.loads(json_dumper.dumps(element))
+            add_metadata_group(self.zarr[type_name], attrs)
+
+        for (part_of, child_class), child_paths in children.items():
             set_haspart_relationship(
-                element.__class__.__name__, element_path, partof_group
+                child_class, child_paths, self.zarr[part_of]
             )
 
-        # Update haspart relationship
-        element = update_haspart_id(element)
-
-        # Add element to metadata
-        attrs = json.loads(json_dumper.dumps(element))
-        add_metadata_group(type_group, attrs)
         self.update_date()
         zarr.consolidate_metadata(self.zarr.store)
 
+    def _get_data_transfers(
+        self, element, source_file: Path | str
+    ) -> List[tuple[Path, Path]]:
+        """List (source, target) file copies needed to store the data
+        file of an element, including its index if any."""
+        source_path = Path(source_file)
+        target_path = Path(element._get("data_path"))
+        transfers = [(source_path, target_path)]
+
+        # Genomic files have an associated index file
+        try:
+            ft = GenomicFileSuffix.from_path(source_path)
+            source_ix = source_path.with_suffix(
+                source_path.suffix + ft.get_index_suffix()
+            )
+            target_ix = target_path.with_suffix(
+                source_path.suffix + ft.get_index_suffix()
+            )
+            transfers.append((source_ix, target_ix))
+        except ValueError:
+            pass
+        return transfers
+
     def update_element(
         self,
         element_id: str,
@@ -531,11 +629,14 @@ class MODO:
         )
 
         modo_ids = {Path(id).name: id for id in modo.metadata.keys()}
+        new_instances = []
         for inst, args in instance_list:
             if inst.id in modo_ids.keys():
                 modo.update_element(modo_ids[inst.id], inst)
             else:
-                modo.add_element(inst, **args)
+                new_instances.append((inst, args))
+        if new_instances:
+            modo.add_elements(new_instances)
         if no_remove:
             return modo
         modo_id = modo_id = modo.zarr["/"].attrs["id"]
@@ -67,7 +67,7 @@ def create(
         typer.Option(
             "--meta",
             "-m",
-            help="Create instance from metadata provided as a json string.",
+            help="Create instance from metadata provided as a json string. Use - to read it from stdin.",
         ),
     ] = None,
 ):
@@ -91,6 +91,7 @@ def create(
         _ = MODO.from_file(from_file, object_path, endpoint=endpoint.modos)
         return
     elif meta:
+        meta = sys.stdin.read() if meta == "-" else meta
         obj = json_loader.loads(meta, target_class=model.MODO)
     else:
         filled = SlotPrompter(endpoint, suggest=False).prompt_for_slots(
@@ -168,7 +169,7 @@ def add(
         typer.Option(
             "--element",
             "-e",
-            help="Create instance from element metadata provided as a json string.",
+            help="Create instance from element metadata provided as a json string. Use - to read it from stdin.",
         ),
     ] = None,
     from_file: Annotated[
@@ -200,6 +201,7 @@ def add(
     elif from_file:
         obj = parse_instance(from_file, target_class=target_class)
     elif element:
+        element = sys.stdin.read() if element == "-" else element
         obj = json_loader.loads(element, target_class=target_class)
     else:
         exclude = {"id": [Path(id).name for id in modo.metadata.keys()]}
@@ -447,3 +449,11 @@ def callback(
 # https://github.com/tiangolo/typer/issues/200#issuecomment-795873331
 
 typer_click_object = typer.main.get_command(cli)
+
+
+def run(argv: List[str]) -> Any:
+    """Run the cli with a list of arguments in the current process.
+    Errors are raised instead of being turned into an exit code."""
+    return typer_click_object.main(
+        args=argv, standalone_mode=False, prog_name="modos"
+    )
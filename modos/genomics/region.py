@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from urllib.parse import parse_qs, urlparse
 from typing import Optional
 
+import numpy as np
+from numpy.typing import ArrayLike
 import pysam
 
 
@@ -19,12 +21,12 @@ class Region:
     end: int | float
 
     def __post_init__(self):
-        if not self.chrom:
-            raise ValueError("Chromosome must be specified")
-        if self.start < 0:
-            raise ValueError("Start must be non-negative")
-        if self.end < self.start:
-            raise ValueError("End must be greater than or equal to start")
+        # The chromosome must be specified, start must be non-negative
+        # and end must be greater than or equal to start.
+        if not self.chrom or self.start < 0 or self.end < self.start:
+            raise ValueError(
+                f"Invalid region: chrom={self.chrom!r} start={self.start} end={self.end}"
+            )
 
     def to_htsget_query(self):
         """Serializes the region into an htsget URL query.
@@ -140,6 +142,29 @@ class Region:
 
         return same_chrom and (starts_in or ends_in)
 
+    def overlaps_many(
+        self,
+        chroms: ArrayLike,
+        starts: ArrayLike,
+        ends: ArrayLike,
+    ) -> np.ndarray:
+        """Vectorized version of overlaps for many regions given
+        as arrays of chromosomes, starts and ends.
+        Returns a boolean mask of regions overlapping with self.
+
+        Example
+        -------
+        >>> Region('chr1', 10, 20).overlaps_many(
+        ...   ['chr1', 'chr1', 'chr2'], [15, 30, 15], [25, 40, 25]
+        ... )
+        array([ True, False, False])
+        """
+        starts, ends = np.asarray(starts), np.asarray(ends)
+        starts_in = (self.start <= starts) & (starts <= self.end)
+        ends_in = (self.start <= ends) & (ends <= self.end)
+
+        return (np.asarray(chroms) == self.chrom) & (starts_in | ends_in)
+
     def contains(self, other: Region) -> bool:
         """Checks if other is fully contained in self."""
         same_chrom = self.chrom == other.chrom
@@ -6,8 +6,8 @@ and for converting instances to different representations.
 from enum import Enum
 from functools import lru_cache, reduce
 from pathlib import Path
+import re
 from typing import Any, Mapping, Optional, Union
-from urllib.parse import urlparse
 
 import zarr
 from linkml_runtime.dumpers import rdflib_dumper
@@ -20,11 +20,13 @@ import modos_schema.schema as schema
 
 
 SCHEMA_PATH = Path(schema.__path__[0]) / "modos_schema.yaml"
+# scheme://netloc, equivalent to urlparse having both scheme and netloc
+URI_PATTERN = re.compile(r"[a-zA-Z][a-zA-Z0-9+.-]*://[^/?#\s]")
 
 
+@lru_cache(maxsize=None)
 def class_from_name(name: str):
-    class_names = list(load_schema().all_classes().keys())
-    if name not in class_names:
+    if name not in load_schema().all_classes():
         raise ValueError(f"Unknown class name: {name}")
     return getattr(model, name)
 
@@ -49,32 +51,46 @@ def is_full_id(element_id: str) -> bool:
     >>> is_full_id("/assay/test_assay")
     True
     """
-    etypes = [elem.value + "/" for elem in ElementType]
-    extended_etypes = etypes + ["/" + etype for etype in etypes]
-    return element_id.startswith(tuple(extended_etypes))
+    return element_id.startswith(FULL_ID_PREFIXES)
 
 
-def set_haspart_relationship(
+def check_haspart_relationship(
     child_class: str,
-    child_path: str,
-    parent_group: zarr.hierarchy.Group,
+    child_path: str | list[str],
+    parent_type_name: str,
+    parent_name: str,
 ):
-    """Add element to the hasPart attribute of a parent zarr group"""
-    parent_type = getattr(
-        model,
-        parent_group.attrs.get("@type"),
-    )
-
+    """Raise a ValueError if a parent of type parent_type_name cannot
+    have children of class child_class."""
+    parent_type = getattr(model, parent_type_name)
     has_prop = get_haspart_property(child_class)
     parent_slots = parent_type.__match_args__
     if has_prop not in parent_slots:
         raise ValueError(
-            f"Cannot make {child_path} part of {parent_group.name}: {parent_type} does not have property {has_prop}"
+            f"Cannot make {child_path} part of {parent_name}: {parent_type} does not have property {has_prop}"
         )
+
+
+def set_haspart_relationship(
+    child_class: str,
+    child_path: str | list[str],
+    parent_group: zarr.hierarchy.Group,
+):
+    """Add element(s) to the hasPart attribute of a parent zarr group.
+    Multiple children of the same class can be given at once, in which
+    case the parent attributes are only written once."""
+    child_paths = [child_path] if isinstance(child_path, str) else child_path
+    check_haspart_relationship(
+        child_class,
+        child_path,
+        parent_group.attrs.get("@type"),
+        parent_group.name,
+    )
+    has_prop = get_haspart_property(child_class)
     # has_part is multivalued
-    if has_prop not in parent_group.attrs:
-        parent_group.attrs[has_prop] = []
-    parent_group.attrs[has_prop] += [child_path]
+    parent_group.attrs[has_prop] = (
+        parent_group.attrs.get(has_prop) or []
+    ) + child_paths
 
 
 def update_haspart_id(
@@ -212,13 +228,28 @@ class ElementType(str, Enum):
                 raise ValueError(f"Unknown object type: {name}")
 
 
-def is_uri(text: str):
-    """Checks if input is a valid URI."""
-    try:
-        result = urlparse(text)
-        return all([result.scheme, result.netloc])
-    except AttributeError:
-        return False
+# Element types are fixed at runtime, compute derived values once
+ELEMENT_TYPE_VALUES = tuple(elem.value for elem in ElementType)
+FULL_ID_PREFIXES = tuple(
+    f"{root}{etype}/" for root in ("", "/") for etype in ELEMENT_TYPE_VALUES
+)
+
+
+def is_uri(text: str) -> bool:
+    """Checks if input is a valid URI.
+
+    Examples
+    --------
+    >>> is_uri("http://example.org/sample1")
+    True
+    >>> is_uri("s3://bucket/key")
+    True
+    >>> is_uri("sample/sample1")
+    False
+    >>> is_uri("file:///tmp/ex")
+    False
+    """
+    return isinstance(text, str) and URI_PATTERN.match(text) is not None
 
 
 @lru_cache(1)
@@ -257,26 +288,53 @@ def instance_to_graph(instance) -> Graph:
         prefix_map=prefixes,
         schemaview=load_schema(),
     )
-    # NOTE: This is a hack to get around the fact that the linkml's
-    # rdf dumper does not iunclude schema:identifier in the graph.
     # Patch schema -> http://schema.org (rdflib's default is https)
     g.bind("schema", "http://schema.org/", replace=True)
+    add_identifier_triple(instance, g)
+    return g
+
+
+def add_instance_triples(instance, graph: Graph) -> None:
+    """Add the triples of an instance directly to an existing graph.
+    Unlike instance_to_graph, no intermediate graph is created and
+    no prefix is bound to the target graph."""
+    rdflib_dumper.inject_triples(instance, load_rdf_schema(), graph)
+    add_identifier_triple(instance, graph)
+
+
+def add_identifier_triple(instance, graph: Graph) -> None:
+    """Add the schema:identifier triple of an instance to a graph."""
+    # NOTE: This is a hack to get around the fact that the linkml's
+    # rdf dumper does not iunclude schema:identifier in the graph.
     try:
         id_slot = (
             load_schema().get_identifier_slot(type(instance).__name__).slot_uri
         )
-        g.add(
+        graph.add(
             (
                 URIRef(instance.id),
-                g.namespace_manager.expand_curie(str(id_slot)),
+                URIRef(load_rdf_schema().expand_curie(str(id_slot))),
                 URIRef(instance.id),
             )
         )
     except AttributeError:
         pass
-    return g
 
 
+@lru_cache(1)
+def load_rdf_schema() -> SchemaView:
+    """Return the schema view with namespaces from the prefixmap
+    registered, as needed to convert instances to RDF."""
+    view = load_schema()
+    namespaces = view.namespaces()
+    for p in load_prefixmap().values():
+        namespaces[p.prefix_prefix] = URIRef(p.prefix_reference)
+    # rdflib's default for schema is https
+    namespaces["schema"] = URIRef("http://schema.org/")
+    return view
+
+
+@lru_cache(maxsize=None)
 def get_slot_range(slot_name: str) -> str:
     """Return the class-independent range of a slot."""
     return load_schema().get_slot(slot_name).range
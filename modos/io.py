@@ -10,12 +10,36 @@ from linkml_runtime.loaders import (
     rdf_loader,
 )
 import modos_schema.datamodel as model
+import yaml
 import zarr
 
 import modos.genomics.cram as cram
 import modos.metabolomics.mztab as mztab
 from modos.helpers.schema import dict_to_instance
 
+# Use the libyaml parser when available
+try:
+    from yaml import CSafeLoader as _BaseYamlLoader
+except ImportError:
+    from yaml import SafeLoader as _BaseYamlLoader
+
+
+class YamlLoader(_BaseYamlLoader):
+    """Safe YAML loader which raises on duplicate keys,
+    as linkml's yaml_loader does."""
+
+    def construct_mapping(self, node, deep=False):
+        keys = set()
+        for key_node, _ in node.value:
+            if key_node.tag == "tag:yaml.org,2002:merge":
+                continue
+            key = self.construct_object(key_node, deep=deep)
+            if key in keys:
+                raise ValueError(f'Duplicate key: "{key}"')
+            keys.add(key)
+        return super().construct_mapping(node, deep=deep)
+
+
 ext2loader = {
     "json": json_loader,
     r"ya?ml": yaml_loader,
@@ -46,7 +70,12 @@ def parse_attributes(path: Path) -> List[dict]:
     loader = get_loader(path)
     if not loader:
         raise ValueError(f"Unsupported file format: {path}")
-    elems = loader.load_as_dict(str(path))
+    if loader is yaml_loader:
+        # Plain dicts are enough, skip linkml's source position tracking
+        with open(path) as yaml_file:
+            elems = yaml.load(yaml_file, Loader=YamlLoader)
+    else:
+        elems = loader.load_as_dict(str(path))
     if not isinstance(elems, list):
         elems = [elems]
     return elems
@@ -1,8 +1,10 @@
+from functools import lru_cache
+
 from linkml_runtime.loaders import json_loader
 import rdflib
 from .helpers.schema import (
+    add_instance_triples,
     get_slot_range,
-    instance_to_graph,
     load_prefixmap,
     load_schema,
 )
@@ -12,50 +14,64 @@ from modos.helpers.schema import (
 )
 
 
+@lru_cache(1)
+def load_namespaces() -> tuple[tuple[str, rdflib.URIRef], ...]:
+    """Return namespace bindings for the schema prefixes,
+    as resolved by rdflib on a new graph."""
+    graph = rdflib.Graph()
+    for prefix in load_prefixmap().values():
+        graph.bind(prefix.prefix_prefix, prefix.prefix_reference, replace=True)
+    return tuple(graph.namespaces())
+
+
+@lru_cache(maxsize=None)
+def is_uri_slot(slot_name: str) -> bool:
+    """Whether values of a slot should be URIs."""
+    slot_range = get_slot_range(slot_name)
+    if not slot_range:
+        return False
+    return (
+        "uri" in slot_range
+        or slot_range in load_schema().all_classes()
+        or slot_name == "data_path"
+    )
+
+
 def attrs_to_graph(meta: dict, uri_prefix: str) -> rdflib.Graph:
     """Convert a attribute dictionary to an RDF graph of metadata."""
-    kg = rdflib.Graph()
-    for prefix in load_prefixmap().values():
-        kg.bind(prefix.prefix_prefix, prefix.prefix_reference, replace=True)
+    kg = rdflib.Graph(bind_namespaces="none")
+    for prefix, namespace in load_namespaces():
+        kg.namespace_manager.bind(
+            prefix, namespace, override=True, replace=True
+        )
 
     # Assuming the dict is flat, i.e. all subjects are top level
     for subject, attrs in meta.items():
         if not is_uri(subject):
             subject = f"{uri_prefix}{subject}"
+        # Shallow copy, the input metadata is left untouched
+        fixed_attrs = attrs | {"id": subject}
         for key, value in attrs.items():
-            if key == "@type":
+            if key in ("@type", "id"):
                 continue
             # Check if slot value should be a URI
             # we need to ensure it is one
-            slot_range = get_slot_range(key)
-            if not slot_range:
+            if not is_uri_slot(key):
                 continue
-            uri_value = any(
-                [
-                    "uri" in slot_range,
-                    slot_range in load_schema().all_classes(),
-                    key == "data_path",
-                ]
-            )
-            if uri_value:
-                # multivalued slots have a list of values
-                if isinstance(value, list):
-                    fixed = []
-                    for item in value:
-                        if is_uri(item):
-                            fixed.append(item)
-                        else:
-                            fixed.append(f"{uri_prefix}{item}")
-                else:
-                    if is_uri(value):
-                        fixed = value
-                    else:
-                        fixed = f"{uri_prefix}{value}"
-                attrs[key] = fixed
-        attrs["id"] = subject
+            # multivalued slots have a list of values
+            if isinstance(value, list):
+                # only copy the list if some items need a prefix
+                if not all(map(is_uri, value)):
+                    fixed_attrs[key] = [
+                        item if is_uri(item) else f"{uri_prefix}{item}"
+                        for item in value
+                    ]
+            elif not is_uri(value):
+                fixed_attrs[key] = f"{uri_prefix}{value}"
         instance = json_loader.loads(
-            attrs,
+            fixed_attrs,
             target_class=class_from_name(attrs["@type"]),
         )
-        kg += instance_to_graph(instance)
+        # Triples are added in place, no per-subject graph is merged
+        add_instance_triples(instance, kg)
     return kg
@@ -1,11 +1,100 @@
 """Functions related to server storage handling"""
 
-from dataclasses import field
-from typing import Mapping, Optional
+from dataclasses import dataclass, field
+from functools import cached_property
+import os
+from typing import Any, Mapping, Optional
+from urllib.parse import urlsplit
 
-from pydantic import HttpUrl, validate_call
-from pydantic.dataclasses import dataclass
+from pydantic import HttpUrl
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+# Use an HTTP/2 client (requires httpx) to multiplex requests
+HTTP2 = os.getenv("MODOS_HTTP2", "false").lower() in ("1", "true", "yes")
+
+
+def _new_session():
+    """Create a client with keep-alive connection pooling and retries.
+    If HTTP2 is enabled, an httpx client is used, otherwise
+    a requests session. Both expose the same get() interface."""
+    if HTTP2:
+        try:
+            import httpx
+        except ImportError:
+            raise ModuleNotFoundError(
+                "httpx[http2] must be installed to use HTTP/2."
+            )
+        transport = httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=16, max_keepalive_connections=16
+            ),
+            retries=3,
+        )
+        return httpx.Client(transport=transport, timeout=10)
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+S3_PREFIX = "s3://"
+
+# Shared across calls so that connections to the same server are reused
+_SESSION = _new_session()
+
+
+def close_session():
+    """Close pooled connections to remote servers.
+    A new session is transparently used for subsequent requests.
+    The session is an httpx client if MODOS_HTTP2 is set, and a
+    requests session otherwise."""
+    global _SESSION
+    _SESSION.close()
+    _SESSION = _new_session()
+
+
+def _validate_url(url: HttpUrl | str) -> str:
+    """Check that url is an absolute http(s) URL and return it
+    as a string without trailing slash.
+
+    Examples
+    --------
+    >>> _validate_url("http://modos.example.org/")
+    'http://modos.example.org'
+    >>> _validate_url("modos.example.org")
+    Traceback (most recent call last):
+      ...
+    ValueError: Invalid http(s) URL: modos.example.org
+    """
+    url = str(url)
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        raise ValueError(f"Invalid http(s) URL: {url}")
+    return url.rstrip("/")
+
+
+def _get_json(url: str, **kwargs) -> Any:
+    """Send a GET request and decode the JSON response body.
+    HTTP error statuses raise requests.HTTPError by default, or
+    httpx.HTTPStatusError if MODOS_HTTP2 is set."""
+    response = _SESSION.get(url=url, **kwargs)
+    response.raise_for_status()
+    return json_loads(response.content)
 
 
 @dataclass(frozen=True)
@@ -35,42 +124,62 @@ class EndpointManager:
     >>> ex = EndpointManager(services={"s3": "http://s3.example.org"})
     >>> ex.s3
     HttpUrl('http://s3.example.org/')
+    >>> ex.endpoints
+    {'s3': HttpUrl('http://s3.example.org/')}
 
     """
 
     modos: Optional[HttpUrl] = None
     services: dict[str, HttpUrl] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Validate urls once at construction, the instance is frozen
+        if self.modos is not None:
+            object.__setattr__(self, "modos", HttpUrl(str(self.modos)))
+        object.__setattr__(
+            self,
+            "services",
+            {name: HttpUrl(str(url)) for name, url in self.services.items()},
+        )
+
+    @cached_property
+    def endpoints(self) -> dict[str, HttpUrl]:
+        """Mapping of available services to their urls.
+        The modos server is only queried on first access,
+        use refresh() to invalidate the cache."""
+        if self.modos:
+            return _get_json(str(self.modos))
+        return self.services or {}
+
     def list(self) -> dict[str, HttpUrl]:
         """List available endpoints."""
-        if self.modos:
-            return requests.get(url=str(self.modos)).json()
-        elif self.services:
-            return self.services
-        else:
-            return {}
+        return self.endpoints
+
+    def refresh(self) -> dict[str, HttpUrl]:
+        """Clear cached endpoints and list them again."""
+        # cached_property stores its value in the instance __dict__
+        self.__dict__.pop("endpoints", None)
+        return self.endpoints
 
     @property
     def s3(self) -> Optional[HttpUrl]:
-        return self.list().get("s3")
+        return self.endpoints.get("s3")
 
     @property
     def fuzon(self) -> Optional[HttpUrl]:
-        return self.list().get("fuzon")
+        return self.endpoints.get("fuzon")
 
     @property
     def htsget(self) -> Optional[HttpUrl]:
-        return self.list().get("htsget")
+        return self.endpoints.get("htsget")
 
 
-@validate_call
-def list_remote_items(url: HttpUrl) -> list[HttpUrl]:
-    return requests.get(url=f"{url}/list").json()["modos"]
+def list_remote_items(url: HttpUrl | str) -> list[HttpUrl]:
+    return _get_json(f"{_validate_url(url)}/list")["modos"]
 
 
-@validate_call
 def get_metadata_from_remote(
-    url: HttpUrl, modo_id: Optional[str] = None
+    url: HttpUrl | str, modo_id: Optional[str] = None
 ) -> Mapping:
     """Function to access metadata from one specific or all modos on a remote server
 
@@ -81,7 +190,7 @@ def get_metadata_from_remote(
     id
         id of the modo to retrieve metadata from. Will return all if not specified (default).
     """
-    meta = requests.get(url=f"{url}/meta").json()
+    meta = _get_json(f"{_validate_url(url)}/meta")
     if modo_id is not None:
         try:
             return meta[modo_id]
@@ -93,13 +202,22 @@ def get_metadata_from_remote(
         return meta
 
 
-def is_s3_path(path: str):
-    """Check if a path is an S3 path"""
-    return path.startswith("s3://")
+def is_s3_path(path: str) -> bool:
+    """Check if a path is an S3 path
+
+    Examples
+    --------
+    >>> is_s3_path("s3://bucket/ex")
+    True
+    >>> is_s3_path("data/ex")
+    False
+    """
+    return path.startswith(S3_PREFIX)
 
 
-@validate_call
-def get_s3_path(url: HttpUrl, query: str, exact_match: bool = False) -> list:
+def get_s3_path(
+    url: HttpUrl | str, query: str, exact_match: bool = False
+) -> list:
     """Request public S3 path of a specific modo or all modos matching the query string
     Parameters
     ----------
@@ -110,7 +228,7 @@ def get_s3_path(url: HttpUrl, query: str, exact_match: bool = False) -> list:
     exact_match
         if True only modos with exactly that id will be returned, otherwise (default) all matching modos
     """
-    return requests.get(
-        url=f"{url}/get",
+    return _get_json(
+        f"{_validate_url(url)}/get",
         params={"query": query, "exact_match": exact_match},
-    ).json()
+    )
@@ -0,0 +1,106 @@
+"""Asynchronous requests to modos servers.
+
+Coroutine counterparts of the helpers in modos.remote. They share a
+caller-provided aiohttp session so that requests to one or several
+servers can be issued concurrently.
+
+Examples
+--------
+>>> import asyncio
+>>> urls = ["http://modos1.example.org", "http://modos2.example.org"]
+>>> asyncio.run(gather_metadata(urls)) # doctest: +SKIP
+[{'ex': {...}}, {'ex2': {...}}]
+"""
+
+import asyncio
+from typing import Any, Iterable, Mapping, Optional
+
+import aiohttp
+from pydantic import HttpUrl
+
+from modos.remote import _validate_url
+
+
+async def _get_json(
+    session: aiohttp.ClientSession,
+    url: str,
+    params: Optional[Mapping[str, Any]] = None,
+) -> Any:
+    async with session.get(url, params=params) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
+async def list_endpoints(
+    session: aiohttp.ClientSession, url: HttpUrl | str
+) -> dict[str, HttpUrl]:
+    """List the service endpoints advertised by a modos server."""
+    return await _get_json(session, _validate_url(url))
+
+
+async def list_remote_items(
+    session: aiohttp.ClientSession, url: HttpUrl | str
+) -> list[HttpUrl]:
+    """List the modos available on a remote server."""
+    return (await _get_json(session, f"{_validate_url(url)}/list"))["modos"]
+
+
+async def get_metadata_from_remote(
+    session: aiohttp.ClientSession,
+    url: HttpUrl | str,
+    modo_id: Optional[str] = None,
+) -> Mapping:
+    """Access metadata from one specific or all modos on a remote server
+
+    Parameters
+    ----------
+    session
+        Client session used to send the request.
+    url
+        Url to the remote modo server
+    modo_id
+        id of the modo to retrieve metadata from. Will return all if not specified (default).
+    """
+    meta = await _get_json(session, f"{_validate_url(url)}/meta")
+    if modo_id is not None:
+        try:
+            return meta[modo_id]
+        except KeyError as e:
+            raise ValueError(
+                f"Could not find metadata for modo with id: {modo_id}"
+            ) from e
+    else:
+        return meta
+
+
+async def get_s3_path(
+    session: aiohttp.ClientSession,
+    url: HttpUrl | str,
+    query: str,
+    exact_match: bool = False,
+) -> list:
+    """Request public S3 path of a specific modo or all modos matching the query string
+
+    Parameters
+    ----------
+    session
+        Client session used to send the request.
+    url
+        Url to the remote modo server
+    query
+        query string to specify the modo of interest
+    exact_match
+        if True only modos with exactly that id will be returned, otherwise (default) all matching modos
+    """
+    # aiohttp only accepts str, int or float query values
+    params = {"query": query, "exact_match": str(exact_match)}
+    return await _get_json(session, f"{_validate_url(url)}/get", params=params)
+
+
+async def gather_metadata(urls: Iterable[HttpUrl | str]) -> list[Mapping]:
+    """Concurrently fetch the metadata of all modos on multiple servers.
+    Results are returned in the same order as the input urls."""
+    async with aiohttp.ClientSession() as session:
+        return await asyncio.gather(
+            *[get_metadata_from_remote(session, url) for url in urls]
+        )
@@ -1,19 +1,19 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 import io
 import os
 from pathlib import Path
 import re
 import shutil
-from typing import Any, ClassVar, Generator, Optional
+from typing import Any, Generator, Optional
 
-from pydantic import Field, HttpUrl
-from pydantic.dataclasses import dataclass
+from pydantic import HttpUrl
 import s3fs
 import zarr
 import zarr.hierarchy as zh
 
 
-from modos.helpers.schema import ElementType
+from modos.helpers.schema import ELEMENT_TYPE_VALUES
 
 ZARR_ROOT = Path("data.zarr")
 S3_ADDRESSING_STYLE = os.getenv("S3_ADDRESSING_STYLE", "auto")
@@ -77,16 +77,23 @@ class LocalStorage(Storage):
     def exists(self, target: Path) -> bool:
         return (self.path / target).exists()
 
-    def list(self, target: Optional[Path] = None):
-        path = self.path / (target or "")
-        for path in path.glob("*"):
-            if path.name.endswith(".zarr"):
-                continue
-            elif path.is_file():
-                yield path
-            for file in path.rglob("*"):
-                if file.is_file():
-                    yield file
+    def list(
+        self, target: Optional[Path] = None
+    ) -> Generator[Path, None, None]:
+        root = self.path / (target or "")
+        if not root.is_dir():
+            return
+        # Single walk over the tree, reusing the type cached by scandir
+        stack = [str(root)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".zarr"):
+                        continue
+                    elif entry.is_file():
+                        yield Path(entry.path)
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
 
     def open(self, target: Path) -> io.BufferedReader:
         return open(self.path / target, "rb")
@@ -100,9 +107,23 @@ class LocalStorage(Storage):
         shutil.copy(source, self.path / target)
 
 
-@dataclass
+# Amazon's official naming rules for S3 URLs [1]_ [2]_
+S3_PATTERN = re.compile(
+    r"^s3://"
+    r"(?=[a-z0-9])"  # Bucket name must start with a letter or digit
+    r"(?!(^xn--|sthree-|sthree-configurator|.+-s3alias$))"  # Bucket name must not start with xn--, sthree-, sthree-configurator or end with -s3alias
+    r"(?!.*\.\.)"  # Bucket name must not contain two adjacent periods
+    r"[a-z0-9][a-z0-9.-]{1,61}[a-z0-9]"  # Bucket naming constraints
+    r"(?<!\.-$)"  # Bucket name must not end with a period followed by a hyphen
+    r"(?<!\.$)"  # Bucket name must not end with a period
+    r"(?<!-$)"  # Bucket name must not end with a hyphen
+    r"(/([a-zA-Z0-9._-]+/?)*)?$"  # key naming constraints
+)
+
+
+@dataclass(frozen=True, slots=True)
 class S3Path:
-    """Pydantic Model for S3 URLs. Performs validation against amazon's official naming rules [1]_ [2]_
+    """S3 URL validated against amazon's official naming rules [1]_ [2]_
 
     .. [1] https://docs.aws.amazon.com/AmazonS3/latest/userguide/bucketnamingrules.html
     .. [2] https://gist.github.com/rajivnarayan/c38f01b89de852b3e7d459cfde067f3f
@@ -112,44 +133,28 @@ class S3Path:
     --------
     >>> S3Path(url="s3://test/ex")
     S3Path(url='s3://test/ex')
-    >>> S3Path(url='s3://?invalid-bucket-name!/def') # doctest: +IGNORE_EXCEPTION_DETAIL
+    >>> S3Path(url="s3://test/ex").bucket
+    'test'
+    >>> S3Path(url='s3://?invalid-bucket-name!/def')
     Traceback (most recent call last):
       ...
-    pydantic_core._pydantic_core.ValidationError: 1 validation error for S3Path
+    ValueError: Invalid S3 URL: s3://?invalid-bucket-name!/def
     """
 
-    _s3_pattern: ClassVar[re.Pattern[str]] = re.compile(
-        r"^s3://"
-        r"(?=[a-z0-9])"  # Bucket name must start with a letter or digit
-        r"(?!(^xn--|sthree-|sthree-configurator|.+-s3alias$))"  # Bucket name must not start with xn--, sthree-, sthree-configurator or end with -s3alias
-        r"(?!.*\.\.)"  # Bucket name must not contain two adjacent periods
-        r"[a-z0-9][a-z0-9.-]{1,61}[a-z0-9]"  # Bucket naming constraints
-        r"(?<!\.-$)"  # Bucket name must not end with a period followed by a hyphen
-        r"(?<!\.$)"  # Bucket name must not end with a period
-        r"(?<!-$)"  # Bucket name must not end with a hyphen
-        r"(/([a-zA-Z0-9._-]+/?)*)?$"  # key naming constraints
-    )
-    url: str = Field(
-        ...,
-        json_schema_extra={"strip_whitespace": True},  # type: ignore
-        pattern=_s3_pattern,
-        min_length=8,
-        max_length=1023,
-    )
+    url: str
+    bucket: str = field(init=False, repr=False, compare=False)
+    key: str = field(init=False, repr=False, compare=False)
 
-    def s3_url_parts(self):
-        path_parts = self.url[5:].split("/")
-        bucket = path_parts.pop(0)
-        key = "/".join(path_parts)
-        return (bucket, key)
+    def __post_init__(self):
+        if not (8 <= len(self.url) <= 1023 and S3_PATTERN.match(self.url)):
+            raise ValueError(f"Invalid S3 URL: {self.url}")
+        # Split once, the url cannot change afterwards
+        bucket, _, key = self.url[5:].partition("/")
+        object.__setattr__(self, "bucket", bucket)
+        object.__setattr__(self, "key", key)
 
-    @property
-    def bucket(self) -> str:
-        return self.s3_url_parts()[0]
-
-    @property
-    def key(self) -> str:
-        return self.s3_url_parts()[1]
+    def s3_url_parts(self):
+        return (self.bucket, self.key)
 
 
 class S3Storage(Storage):
@@ -160,26 +165,22 @@ class S3Storage(Storage):
         s3_kwargs: Optional[dict[str, Any]] = None,
     ):
         self._path = S3Path(url=path)
+        self._fs_path = Path(f"{self._path.bucket}/{self._path.key}")
         self.endpoint = s3_endpoint
         s3_opts = s3_kwargs or {"anon": True}
         fs = connect_s3(s3_endpoint, s3_opts)
-        if fs.exists(str(self.path / ZARR_ROOT)):
-            zarr_s3_opts = s3_opts | {"endpoint_url": str(s3_endpoint)}
-
-            self._zarr = zarr.convenience.open(
-                f"{self._path.url}/{ZARR_ROOT}",
-                storage_options=zarr_s3_opts,
-            )
-        else:
+        # The zarr store shares the filesystem (and its client)
+        zarr_store = zarr.storage.FSStore(str(self.path / ZARR_ROOT), fs=fs)
+        # Opening directly saves a request compared to checking first
+        try:
+            self._zarr = zarr.open_group(zarr_store, mode="r+")
+        except zarr.errors.GroupNotFoundError:
             fs.mkdirs(self.path, exist_ok=True)
-            zarr_store = zarr.storage.FSStore(
-                str(self.path / ZARR_ROOT), fs=fs
-            )
             self._zarr = init_zarr(zarr_store)
 
     @property
     def path(self) -> Path:
-        return Path(f"{self._path.bucket}/{self._path.key}")
+        return self._fs_path
 
     @property
     def zarr(self) -> zh.Group:
@@ -193,15 +194,15 @@ class S3Storage(Storage):
         self, target: Optional[Path] = None
     ) -> Generator[Path, None, None]:
         fs = self.zarr.store.fs
-        path = self.path / (target or "")
-        for node in fs.glob(f"{path}/*"):
-            if Path(node).name.endswith(".zarr"):
+        # S3 keys are plain strings, stay in str until yielding
+        base = f"{self.path}/{target}" if target else str(self.path)
+        prefix = f"{base}/"
+        # A single recursive listing, instead of one request per node
+        for node in fs.find(base):
+            relative = node.removeprefix(prefix)
+            if ".zarr/" in relative or relative.endswith(".zarr"):
                 continue
-            elif fs.isfile(node):
-                yield Path(node)
-            elif fs.isdir(node):
-                for file in fs.find(node):
-                    yield Path(file)
+            yield Path(node)
 
     def open(self, target: Path) -> io.BufferedReader:
         return self.zarr.store.fs.open(str(self.path / target))
@@ -221,8 +222,7 @@ class S3Storage(Storage):
 def init_zarr(zarr_store: zarr.storage.Store) -> zh.Group:
     """Initialize object's directory and metadata structure."""
     data = zh.group(store=zarr_store)
-    elem_types = [t.value for t in ElementType]
-    for elem_type in elem_types:
+    for elem_type in ELEMENT_TYPE_VALUES:
         data.create_group(elem_type)
 
     return data
@@ -231,6 +231,9 @@ def init_zarr(zarr_store: zarr.storage.Store) -> zh.Group:
 def connect_s3(
     endpoint: HttpUrl, s3_kwargs: dict[str, Any]
 ) -> s3fs.S3FileSystem:
+    """Return a filesystem for the S3 endpoint.
+    Instances are cached by fsspec, so that repeated calls with the
+    same endpoint and options share one client and connection pool."""
     return s3fs.S3FileSystem(
         endpoint_url=str(endpoint),
         config_kwargs={"s3": {"addressing_style": S3_ADDRESSING_STYLE}},
@@ -238,6 +241,12 @@ def connect_s3(
     )
 
 
+def reset_s3_cache():
+    """Drop cached S3 filesystems, the next connect_s3 call
+    creates a new client."""
+    s3fs.S3FileSystem.clear_instance_cache()
+
+
 def add_metadata_group(parent_group: zh.Group, metadata: dict) -> None:
     """Add input metadata dictionary to an existing zarr group."""
     # zarr groups cannot have slashes in their names
@@ -1,12 +1,17 @@
 """Common fixtures for testing"""
 
+import os
+
+from linkml_runtime.dumpers import json_dumper
 import modos_schema.datamodel as model
 import pytest
 import shutil
 
+from minio import Minio
+from minio.deleteobjects import DeleteObject
 from modos.api import MODO
+from modos.storage import reset_s3_cache, ZARR_ROOT
 from pathlib import Path
-from testcontainers.minio import MinioContainer
 
 ## Add --runslow option
 # see: https://docs.pytest.org/en/latest/example/simple.html#control-skipping-of-tests-according-to-command-line-option
@@ -28,22 +33,90 @@ def pytest_collection_modifyitems(config, items):
         return
     skip_slow = pytest.mark.skip(reason="need --runslow option to run")
     for item in items:
-        if "slow" in item.keywords:
+        if item.get_closest_marker("slow") is not None:
             item.add_marker(skip_slow)
 
 
 ## Test instances
 
 
-# A test MODO
+def link_or_copy(src, dst):
+    """Hardlink a file, or copy it if the filesystem does not allow it."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def copy_modo(template: Path, path: Path) -> MODO:
+    """Copy a MODO directory and open the copy.
+    Zarr files are hardlinked: zarr replaces files instead of writing
+    them in place, so the template is never modified. Data files are
+    copied, since storage writes them in place."""
+    shutil.copytree(
+        template,
+        path,
+        dirs_exist_ok=True,
+        ignore=shutil.ignore_patterns(str(ZARR_ROOT)),
+    )
+    shutil.copytree(
+        template / ZARR_ROOT,
+        path / ZARR_ROOT,
+        dirs_exist_ok=True,
+        copy_function=link_or_copy,
+    )
+    return MODO(path)
+
+
+# MODOs built once and copied for each test
+@pytest.fixture(scope="session")
+def modo_template(tmp_path_factory) -> Path:
+    path = tmp_path_factory.mktemp("modo_template")
+    MODO.from_file(Path("data", "ex_config.yaml"), path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def empty_modo_template(tmp_path_factory) -> Path:
+    path = tmp_path_factory.mktemp("empty_modo_template")
+    MODO(path)
+    return path
+
+
 @pytest.fixture
-def test_modo(tmp_path):
-    modo = MODO.from_file(Path("data", "ex_config.yaml"), tmp_path)
-    return modo
+def test_modo(tmp_path, modo_template):
+    return copy_modo(modo_template, tmp_path)
 
 
-# different schema entities
 @pytest.fixture
+def empty_modo(tmp_path, empty_modo_template):
+    return copy_modo(empty_modo_template, tmp_path)
+
+
+# A MODO shared by tests which do not modify it
+@pytest.fixture(scope="session")
+def read_only_modo(tmp_path_factory, modo_template):
+    return copy_modo(modo_template, tmp_path_factory.mktemp("ro_modo"))
+
+
+# The example MODO shipped with the repository, only read by tests
+@pytest.fixture(scope="session")
+def ex_modo():
+    return MODO("data/ex")
+
+
+@pytest.fixture(scope="session")
+def cram_file_path(read_only_modo) -> str:
+    return next(
+        str(fi)
+        for fi in read_only_modo.list_files()
+        if str(fi).endswith("cram")
+    )
+
+
+# different schema entities, they are built once and shared
+# across tests which must not modify them.
+@pytest.fixture(scope="session")
 def data_entity():
     return model.DataEntity(
         id="test_data",
@@ -53,14 +126,14 @@ def data_entity():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def assay():
     return model.Assay(
         id="test_assay", name="test_assay", omics_type="GENOMICS"
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample():
     return model.Sample(
         id="test_sample",
@@ -70,31 +143,126 @@ def sample():
     )
 
 
+# JSON serialization of the entities, as passed to the CLI
+@pytest.fixture(scope="session")
+def data_json(data_entity) -> str:
+    return json_dumper.dumps(data_entity)
+
+
+@pytest.fixture(scope="session")
+def assay_json(assay) -> str:
+    return json_dumper.dumps(assay)
+
+
+@pytest.fixture(scope="session")
+def sample_json(sample) -> str:
+    return sample._as_json
+
+
 ## testcontainers setup
-# minio
+# minio, a single container is shared by all xdist workers
+
+MINIO_KEY = pytest.StashKey()
 
-minio = MinioContainer()
 
+def start_minio():
+    """Start a minio container."""
+    # Imported here to keep docker out of local test runs
+    from testcontainers.minio import MinioContainer
 
-@pytest.fixture(scope="module")
-def setup(request):
+    minio = MinioContainer()
     minio.start()
+    return minio
+
+
+def pytest_sessionstart(session):
+    """With xdist, the controller owns the container so that it lives
+    until all workers are done."""
+    config = session.config
+    if hasattr(config, "workerinput"):
+        return
+    if config.pluginmanager.getplugin("dsession") is None:
+        # not running with xdist, the setup fixture starts it lazily
+        return
+    if not config.getoption("--runslow"):
+        # tests using minio are all marked as slow
+        return
+    try:
+        config.stash[MINIO_KEY] = start_minio()
+    except Exception as err:
+        # Workers report the error in the tests which need minio
+        config.stash[MINIO_KEY] = err
 
-    def remove_container():
+
+def pytest_sessionfinish(session):
+    minio = session.config.stash.get(MINIO_KEY, None)
+    if minio is not None and not isinstance(minio, Exception):
         minio.stop()
 
-    request.addfinalizer(remove_container)
-    client = minio.get_client()
-    client.make_bucket("test")
-    yield {"minio": minio}
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the container config to an xdist worker."""
+    minio = node.config.stash.get(MINIO_KEY, None)
+    if minio is None:
+        return
+    if isinstance(minio, Exception):
+        node.workerinput["minio"] = {"error": repr(minio)}
+    else:
+        node.workerinput["minio"] = minio.get_config()
+
+
+@pytest.fixture(scope="session")
+def setup(request, worker_id):
+    if worker_id == "master":
+        # not running with xdist
+        minio = start_minio()
+        request.addfinalizer(minio.stop)
+        config = minio.get_config()
+    else:
+        # started by the controller in pytest_sessionstart
+        config = request.config.workerinput["minio"]
+        if "error" in config:
+            raise RuntimeError(f"Could not start minio: {config['error']}")
+
+    client = Minio(
+        config["endpoint"],
+        access_key=config["access_key"],
+        secret_key=config["secret_key"],
+        secure=False,
+    )
+    # Each worker has its own bucket so that tests can run in parallel
+    bucket = f"test-{worker_id}"
+    if not client.bucket_exists(bucket):
+        client.make_bucket(bucket)
+    yield {
+        "endpoint": f"http://{config['endpoint']}",
+        "creds": {"key": config["access_key"], "secret": config["secret_key"]},
+        "client": client,
+        "bucket": bucket,
+    }
+
+
+@pytest.fixture()
+def clean_bucket(setup):
+    """Remove objects written by a test, keeping the container alive."""
+    yield
+    client, bucket = setup["client"], setup["bucket"]
+    objects = client.list_objects(bucket, prefix="ex/", recursive=True)
+    errors = client.remove_objects(
+        bucket, (DeleteObject(o.object_name) for o in objects)
+    )
+    # deletion is lazy, errors must be consumed to apply it
+    for error in errors:
+        raise RuntimeError(f"Could not clean test bucket: {error}")
+    # Drop cached s3 listings of the removed objects
+    reset_s3_cache()
 
 
 @pytest.fixture()
-def remote_modo(setup):
-    minio_endpoint = setup["minio"].get_config()["endpoint"]
-    minio_creds = {"secret": "minioadmin", "key": "minioadmin"}
+def remote_modo(setup, clean_bucket):
     return MODO(
-        "s3://test/ex",
-        services={"s3": f"http://{minio_endpoint}"},
-        s3_kwargs=minio_creds,
+        f"s3://{setup['bucket']}/ex",
+        services={"s3": setup["endpoint"]},
+        s3_kwargs=setup["creds"],
     )
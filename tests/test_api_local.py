@@ -2,10 +2,9 @@
 """
 from typing import Iterator
 from pathlib import Path
-import re
 
 import modos_schema.datamodel as model
-import pysam
+import pytest
 
 from modos.api import MODO
 
@@ -14,8 +13,8 @@ REF_PATH = "data/ex/reference.fa"
 ## Initialize modo
 
 
-def test_read_modo():
-    MODO("data/ex")
+def test_read_modo(ex_modo):
+    assert ex_modo.path.name == "ex"
 
 
 def test_init_modo(tmp_path):
@@ -26,20 +25,51 @@ def test_init_modo_from_yaml(tmp_path):
     MODO.from_file("data/ex_config.yaml", tmp_path)
 
 
+def test_init_modo_from_yaml_duplicate_key(tmp_path):
+    config = tmp_path / "config.yaml"
+    config.write_text(
+        '- element:\n    id: ex\n    id: ex2\n    "@type": MODO\n'
+    )
+    with pytest.raises(ValueError, match="Duplicate key"):
+        MODO.from_file(config, tmp_path / "ex")
+
+
 ## Add element
 
 
-def test_add_element(assay, tmp_path):
-    modo = MODO(tmp_path)
-    modo.add_element(assay)
-    assert "assay/test_assay" in modo.metadata.keys()
+def test_add_element(assay, empty_modo):
+    empty_modo.add_element(assay)
+    assert "assay/test_assay" in empty_modo.metadata.keys()
+
+
+def test_add_data(data_entity, empty_modo):
+    empty_modo.add_element(data_entity, source_file="data/ex/demo1.cram")
+    names = {fi.name for fi in empty_modo.list_files()}
+    assert "demo1.cram" in names
+    assert "demo1.cram.crai" in names
+
+
+def test_add_elements(assay, sample, data_entity, empty_modo):
+    empty_modo.add_elements(
+        [
+            (assay, {}),
+            (sample, {"part_of": "assay/test_assay"}),
+            (data_entity, {"source_file": "data/ex/demo1.cram"}),
+        ]
+    )
+    assert "sample/test_sample" in empty_modo.metadata["assay/test_assay"].get(
+        "has_sample"
+    )
+    assert any(fi.name == "demo1.cram.crai" for fi in empty_modo.list_files())
 
 
-def test_add_data(data_entity, tmp_path):
-    modo = MODO(tmp_path)
-    modo.add_element(data_entity, source_file="data/ex/demo1.cram")
-    assert "demo1.cram" in [fi.name for fi in modo.list_files()]
-    assert "demo1.cram.crai" in [fi.name for fi in modo.list_files()]
+def test_add_elements_unknown_argument(assay, sample, empty_modo):
+    before = empty_modo.metadata
+    with pytest.raises(TypeError, match="partof"):
+        empty_modo.add_elements(
+            [(assay, {}), (sample, {"partof": "assay/test_assay"})]
+        )
+    assert empty_modo.metadata == before
 
 
 def test_add_to_parent(sample, test_modo):
@@ -49,6 +79,27 @@ def test_add_to_parent(sample, test_modo):
     )
 
 
+def test_add_to_missing_parent(sample, data_entity, empty_modo):
+    before = empty_modo.metadata
+    with pytest.raises(KeyError):
+        empty_modo.add_element(sample, part_of="assay/nope")
+    with pytest.raises(KeyError):
+        empty_modo.add_element(
+            data_entity,
+            source_file="data/ex/demo1.cram",
+            part_of="assay/nope",
+        )
+    assert empty_modo.metadata == before
+    assert not list(empty_modo.list_files())
+
+
+def test_add_to_wrong_parent(assay, test_modo):
+    before = test_modo.metadata
+    with pytest.raises(ValueError, match="Cannot make assay/test_assay part"):
+        test_modo.add_element(assay, part_of="sample/sample1")
+    assert test_modo.metadata == before
+
+
 ## Remove element
 
 
@@ -107,24 +158,33 @@ def test_enrich_metadata(test_modo):
     assert "sequence/BA000007.3_bd7522" in test_modo.metadata.keys()
 
 
+## Knowledge graph
+
+
+def test_knowledge_graph_prefixes(read_only_modo):
+    turtle = read_only_modo.knowledge_graph().serialize(format="turtle")
+    assert "@prefix NCIT:" in turtle
+    assert "NCIT:C" in turtle
+
+
 ## Stream cram
 
 
-def test_stream_genomics_no_region(test_modo):
-    modo_files = [str(fi) for fi in test_modo.list_files()]
-    file_path = list(filter(lambda x: re.search(r"cram$", x), modo_files))
-    seq = test_modo.stream_genomics(
-        file_path=file_path[0], reference_filename=REF_PATH
+def test_stream_genomics_no_region(read_only_modo, cram_file_path):
+    import pysam
+
+    seq = read_only_modo.stream_genomics(
+        file_path=cram_file_path, reference_filename=REF_PATH
     )
     assert isinstance(seq, Iterator)
     assert isinstance(next(seq), pysam.AlignedSegment)
 
 
-def test_stream_genomics_region(test_modo):
-    modo_files = [str(fi) for fi in test_modo.list_files()]
-    file_path = list(filter(lambda x: re.search(r"cram$", x), modo_files))
-    seq = test_modo.stream_genomics(
-        file_path=file_path[0],
+def test_stream_genomics_region(read_only_modo, cram_file_path):
+    import pysam
+
+    seq = read_only_modo.stream_genomics(
+        file_path=cram_file_path,
         region="BA000007.3",
         reference_filename=REF_PATH,
     )
@@ -10,14 +10,13 @@ import pytest
 
 
 @pytest.mark.slow
+@pytest.mark.usefixtures("clean_bucket")
 def test_multi_modos(setup):
-    minio_endpoint = setup["minio"].get_config()["endpoint"]
-    minio_creds = {"secret": "minioadmin", "key": "minioadmin"}
     for _ in range(3):
         MODO(
-            "s3://test/ex",
-            services={"s3": f"http://{minio_endpoint}"},
-            s3_kwargs=minio_creds,
+            f"s3://{setup['bucket']}/ex",
+            services={"s3": setup["endpoint"]},
+            s3_kwargs=setup["creds"],
         )
 
 
@@ -33,8 +32,9 @@ def test_add_element(assay, remote_modo):
 @pytest.mark.slow
 def test_add_data(data_entity, remote_modo):
     remote_modo.add_element(data_entity, source_file="data/ex/demo1.cram")
-    assert "demo1.cram" in [fi.name for fi in remote_modo.list_files()]
-    assert "demo1.cram.crai" in [fi.name for fi in remote_modo.list_files()]
+    names = {fi.name for fi in remote_modo.list_files()}
+    assert "demo1.cram" in names
+    assert "demo1.cram.crai" in names
 
 
 ## Remove element
@@ -52,22 +52,14 @@ def test_remove_element(sample, remote_modo):
 
 
 @pytest.mark.slow
-def test_remove_modo(setup):
-    # NOTE: We build a new modo to prevent remote_modo from being deleted
-    # in following tests.
-    minio_client = setup["minio"].get_client()
-    minio_endpoint = setup["minio"].get_config()["endpoint"]
-    minio_creds = {"secret": "minioadmin", "key": "minioadmin"}
-    modo = MODO(
-        "s3://test/remove_ex",
-        services={"s3": f"http://{minio_endpoint}"},
-        s3_kwargs=minio_creds,
-    )
-    objects = minio_client.list_objects("test")
-    assert "remove_ex/" in [o.object_name for o in objects]
-    modo.remove_object()
-    objects = minio_client.list_objects("test")
-    assert "remove_ex/" not in [o.object_name for o in objects]
+def test_remove_modo(setup, remote_modo):
+    # remote_modo is recreated for each test, it can safely be deleted
+    minio_client = setup["client"]
+    objects = minio_client.list_objects(setup["bucket"])
+    assert "ex/" in [o.object_name for o in objects]
+    remote_modo.remove_object()
+    objects = minio_client.list_objects(setup["bucket"])
+    assert "ex/" not in [o.object_name for o in objects]
 
 
 ## Update element
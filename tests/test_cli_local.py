@@ -1,83 +1,112 @@
 """Tests for the local use of multi-omics digital object (modo) CLI
 """
 
-from typer.testing import CliRunner
+import io
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
 
-from linkml_runtime.dumpers import json_dumper
 from modos.api import MODO
-from modos.cli import cli
+from modos.cli import add, create, remove, run
+from modos.helpers.schema import UserElementType
+
+# Commands are called directly with the context set by the cli callback
+CTX = SimpleNamespace(obj=SimpleNamespace(endpoint=None))
+MODO_JSON = '{"id":"test", "creation_date": "2024-05-14", "last_update_date": "2024-05-14"}'
+SAMPLE_JSON = '{"id": "test_sample", "name": "test_sample"}'
+DATA_JSON = '{"id": "test_data", "name": "test_data", "data_path": "test.cram", "data_format": "CRAM"}'
+
+## Parse command line arguments
+
+# Command line arguments and the resulting state of the MODO
+CLI_CASES = {
+    "create": (
+        lambda path: ["create", "-m", MODO_JSON, str(path / "test")],
+        lambda path: MODO(path / "test")
+        .metadata["test"]["creation_date"]
+        .startswith("2024-05-14"),
+    ),
+    "add": (
+        lambda path: [
+            "add",
+            "-p",
+            "assay/assay1",
+            "-s",
+            "data/ex/demo1.cram",
+            "-e",
+            DATA_JSON,
+            str(path),
+            "data",
+        ],
+        lambda path: "data/test_data"
+        in MODO(path).metadata["assay/assay1"]["has_data"]
+        and (path / "test.cram.crai").exists(),
+    ),
+    "remove": (
+        lambda path: ["remove", "--force", str(path), "data/demo1"],
+        lambda path: "data/demo1" not in MODO(path).metadata
+        and not (path / "demo1.cram").exists(),
+    ),
+}
+
+
+@pytest.mark.parametrize("command", CLI_CASES)
+def test_cli_smoke(command, test_modo, tmp_path):
+    argv, check = CLI_CASES[command]
+    run(argv(tmp_path))
+    assert check(tmp_path)
 
-runner = CliRunner()
 
 ## Initialize modo / modos create
 
 
 def test_create_modo(tmp_path):
-    result = runner.invoke(
-        cli,
-        [
-            "create",
-            "-m",
-            '{"id":"test", "creation_date": "2024-05-14", "last_update_date": "2024-05-14"}',
-            str(tmp_path) + "/test",
-        ],
-    )
-    assert result.exit_code == 0
+    create(CTX, str(tmp_path / "test"), meta=MODO_JSON)
+    assert MODO(tmp_path / "test").metadata["test"]
 
 
 def test_create_modo_from_yaml(tmp_path):
-    result = runner.invoke(
-        cli, ["create", "-f", "data/ex_config.yaml", str(tmp_path) + "/test"]
-    )
-    assert result.exit_code == 0
+    create(CTX, str(tmp_path / "test"), from_file=Path("data/ex_config.yaml"))
+    assert "sample/sample1" in MODO(tmp_path / "test").list_samples()
 
 
 ## Add element / modos add
 
 
-def test_add_element(tmp_path, assay):
+def test_add_element(tmp_path, assay_json):
+    add(CTX, str(tmp_path), UserElementType.ASSAY, element=assay_json)
     modo = MODO(tmp_path)
-    assay_json = json_dumper.dumps(assay)
-    result = runner.invoke(
-        cli, ["add", "-e", assay_json, str(tmp_path), "assay"]
-    )
-    assert result.exit_code == 0
     assert "assay/test_assay" in modo.metadata.keys()
 
 
-def test_add_data(tmp_path, data_entity):
-    modo = MODO(tmp_path)
-    result = runner.invoke(
-        cli,
-        [
-            "add",
-            "-e",
-            json_dumper.dumps(data_entity),
-            "-s",
-            "data/ex/demo1.cram",
-            str(tmp_path),
-            "data",
-        ],
-    )
-    assert result.exit_code == 0
-    assert (tmp_path / "demo1.cram") in modo.list_files()
-    assert (tmp_path / "demo1.cram.crai") in modo.list_files()
+def test_add_element_from_stdin(tmp_path, assay_json, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO(assay_json))
+    add(CTX, str(tmp_path), UserElementType.ASSAY, element="-")
+    assert "assay/test_assay" in MODO(tmp_path).metadata.keys()
 
 
-def test_add_to_parent(tmp_path, test_modo, sample):
-    result = runner.invoke(
-        cli,
-        [
-            "add",
-            "-e",
-            sample._as_json,
-            "-p",
-            "assay/assay1",
-            str(tmp_path),
-            "sample",
-        ],
+def test_add_data(tmp_path, data_json):
+    add(
+        CTX,
+        str(tmp_path),
+        UserElementType.DATA_ENTITY,
+        element=data_json,
+        source_file=Path("data/ex/demo1.cram"),
+    )
+    files = set(MODO(tmp_path).list_files())
+    assert tmp_path / "demo1.cram" in files
+    assert tmp_path / "demo1.cram.crai" in files
+
+
+def test_add_to_parent(tmp_path, test_modo, sample_json):
+    add(
+        CTX,
+        str(tmp_path),
+        UserElementType.SAMPLE,
+        parent="assay/assay1",
+        element=sample_json,
     )
-    assert result.exit_code == 0
     assert "sample/test_sample" in test_modo.metadata["assay/assay1"].get(
         "has_sample"
     )
@@ -86,20 +115,25 @@ def test_add_to_parent(tmp_path, test_modo, sample):
 ## Remove element
 
 
+def assay_samples(modo: MODO) -> dict:
+    """Samples linked to each assay, from a single metadata read."""
+    return {
+        path: attrs["has_sample"]
+        for path, attrs in modo.metadata.items()
+        if path.startswith("assay/")
+    }
+
+
 def test_remove_element(test_modo, tmp_path):
     assert "sample/sample1" in test_modo.list_samples()
-    result = runner.invoke(cli, ["remove", str(tmp_path), "sample/sample1"])
-    assert result.exit_code == 0
+    remove(CTX, str(tmp_path), "sample/sample1")
     assert "sample/sample1" not in test_modo.list_samples()
 
 
 def test_remove_element_link_list(test_modo, tmp_path):
-    assert "sample/sample1" in test_modo.zarr["assay/assay1"].attrs.get(
-        "has_sample"
-    )
-    result = runner.invoke(cli, ["remove", str(tmp_path), "sample/sample1"])
-    assert result.exit_code == 0
-    assert test_modo.zarr["assay/assay1"].attrs["has_sample"] is None
+    assert "sample/sample1" in assay_samples(test_modo)["assay/assay1"]
+    remove(CTX, str(tmp_path), "sample/sample1")
+    assert assay_samples(test_modo)["assay/assay1"] is None
 
 
 ## Remove modo
@@ -107,14 +141,10 @@ def test_remove_element_link_list(test_modo, tmp_path):
 
 def test_remove_modo(test_modo, tmp_path):
     assert test_modo.path.exists()
-    result = runner.invoke(
-        cli, ["remove", "--force", str(tmp_path), test_modo.path.name]
-    )
-    assert result.exit_code == 0
+    remove(CTX, str(tmp_path), test_modo.path.name, force=True)
     assert not test_modo.path.exists()
 
 
 def test_not_remove_modo_without_force(test_modo, tmp_path):
-    result = runner.invoke(cli, ["remove", str(tmp_path), test_modo.path.name])
-    assert result.exit_code == 1
-    assert isinstance(result.exception, ValueError)
+    with pytest.raises(ValueError):
+        remove(CTX, str(tmp_path), test_modo.path.name)
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from modos.genomics.region import Region
 
@@ -22,6 +23,25 @@ def test_overlap():
     assert not region3.overlaps(region1)
 
 
+@pytest.mark.parametrize(
+    "query",
+    [
+        Region(chrom="chr1", start=1000, end=2000),
+        Region(chrom="chr2", start=0, end=float("inf")),
+    ],
+)
+def test_overlaps_many(query):
+    rng = np.random.default_rng(42)
+    chroms = rng.choice(["chr1", "chr2", "chr3"], size=10_000)
+    starts = rng.integers(0, 10_000, size=10_000)
+    ends = starts + rng.integers(0, 500, size=10_000)
+    expected = [
+        query.overlaps(Region(chrom, start, end))
+        for chrom, start, end in zip(chroms, starts, ends)
+    ]
+    assert query.overlaps_many(chroms, starts, ends).tolist() == expected
+
+
 def test_contain():
     region1 = Region(chrom="chr1", start=10, end=20)
     region2 = Region(chrom="chr1", start=15, end=18)
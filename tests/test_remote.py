@@ -0,0 +1,115 @@
+"""Tests for the synchronous requests to modos servers
+"""
+import asyncio
+from collections import Counter
+import json
+import threading
+
+from aiohttp import test_utils
+import pytest
+import requests
+
+import modos.remote as remote
+from modos.remote import (
+    EndpointManager,
+    get_metadata_from_remote,
+    get_s3_path,
+    list_remote_items,
+)
+
+from test_remote_async import make_app, META
+
+
+@pytest.fixture
+def server():
+    """Serve make_app from a background event loop.
+    Yields the server url and the number of requests per path."""
+    hits = Counter()
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    test_server = test_utils.TestServer(make_app(hits))
+    asyncio.run_coroutine_threadsafe(test_server.start_server(), loop).result()
+    yield str(test_server.make_url("/")), hits
+    asyncio.run_coroutine_threadsafe(test_server.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.fixture(params=["requests", "httpx"])
+def transport(request, monkeypatch):
+    """Use a fresh pooled session of each transport."""
+    if request.param == "httpx":
+        pytest.importorskip("httpx")
+    monkeypatch.setattr(remote, "HTTP2", request.param == "httpx")
+    session = remote._new_session()
+    monkeypatch.setattr(remote, "_SESSION", session)
+    yield request.param
+    session.close()
+
+
+def http_error(transport: str) -> type[Exception]:
+    """The exception raised on HTTP error statuses by a transport."""
+    if transport == "httpx":
+        import httpx
+
+        return httpx.HTTPStatusError
+    return requests.HTTPError
+
+
+def test_new_session_transport(transport):
+    assert type(remote._SESSION).__module__.split(".")[0] == transport
+
+
+def test_list_remote_items(server, transport):
+    url, _ = server
+    assert list_remote_items(url) == ["s3://bucket/ex"]
+
+
+def test_get_metadata_from_remote(server, transport):
+    url, _ = server
+    assert get_metadata_from_remote(url, modo_id="ex") == META["ex"]
+    with pytest.raises(ValueError):
+        get_metadata_from_remote(url, modo_id="nope")
+
+
+def test_get_s3_path(server, transport):
+    url, _ = server
+    params = get_s3_path(url, "ex", exact_match=True)
+    # requests sends True, httpx sends true
+    assert params[0]["query"] == "ex"
+    assert params[0]["exact_match"].lower() == "true"
+
+
+def test_get_json_status(server, transport):
+    url, _ = server
+    with pytest.raises(http_error(transport)):
+        remote._get_json(f"{url}missing")
+
+
+def test_get_json_stdlib_decoder(server, transport, monkeypatch):
+    url, _ = server
+    monkeypatch.setattr(remote, "json_loads", json.loads)
+    assert remote._get_json(f"{url}meta") == META
+
+
+def test_endpoints_cached(server, transport):
+    url, hits = server
+    endpoints = EndpointManager(modos=url)
+    assert endpoints.s3 == "http://s3.example.org"
+    assert endpoints.htsget is None
+    assert endpoints.fuzon is None
+    assert hits["/"] == 1
+    endpoints.refresh()
+    endpoints.s3
+    assert hits["/"] == 2
+
+
+def test_close_session(server, transport):
+    url, _ = server
+    session = remote._SESSION
+    remote.close_session()
+    assert remote._SESSION is not session
+    assert list_remote_items(url) == ["s3://bucket/ex"]
+    remote._SESSION.close()
@@ -0,0 +1,124 @@
+"""Tests for the asynchronous requests to modos servers
+"""
+import asyncio
+from collections import Counter
+from typing import Optional
+
+import aiohttp
+from aiohttp import test_utils, web
+from pydantic import HttpUrl
+import pytest
+
+from modos.remote_async import (
+    gather_metadata,
+    get_metadata_from_remote,
+    get_s3_path,
+    list_endpoints,
+    list_remote_items,
+)
+
+META = {"ex": {"ex": {"@type": "MODO", "id": "ex"}}}
+
+
+def make_app(hits: Optional[Counter] = None) -> web.Application:
+    """A minimal modos server answering with fixed payloads.
+    Requests are counted by path in hits, if given."""
+
+    @web.middleware
+    async def count_hits(request, handler):
+        if hits is not None:
+            hits[request.path] += 1
+        return await handler(request)
+
+    async def root(request):
+        return web.json_response({"s3": "http://s3.example.org"})
+
+    async def list_modos(request):
+        return web.json_response({"modos": ["s3://bucket/ex"]})
+
+    async def meta(request):
+        return web.json_response(META)
+
+    async def get(request):
+        # echo the query parameters to check how they are sent
+        return web.json_response([dict(request.query)])
+
+    app = web.Application(middlewares=[count_hits])
+    app.router.add_get("/", root)
+    app.router.add_get("/list", list_modos)
+    app.router.add_get("/meta", meta)
+    app.router.add_get("/get", get)
+    return app
+
+
+def run_with_server(request_fn, n_servers: int = 1):
+    """Start test servers and call request_fn with their urls."""
+
+    async def main():
+        servers = [test_utils.TestServer(make_app()) for _ in range(n_servers)]
+        for server in servers:
+            await server.start_server()
+        try:
+            # trailing slashes must be stripped from urls
+            urls = [str(server.make_url("/")) for server in servers]
+            return await request_fn(urls)
+        finally:
+            for server in servers:
+                await server.close()
+
+    return asyncio.run(main())
+
+
+def with_session(request_fn):
+    async def call(urls):
+        async with aiohttp.ClientSession() as session:
+            return await request_fn(session, urls[0])
+
+    return call
+
+
+def test_list_endpoints():
+    endpoints = run_with_server(with_session(list_endpoints))
+    assert endpoints == {"s3": "http://s3.example.org"}
+
+
+def test_list_remote_items_http_url():
+    async def request_fn(session, url):
+        return await list_remote_items(session, HttpUrl(url))
+
+    assert run_with_server(with_session(request_fn)) == ["s3://bucket/ex"]
+
+
+def test_get_metadata_from_remote():
+    async def request_fn(session, url):
+        return await get_metadata_from_remote(session, url, modo_id="ex")
+
+    assert run_with_server(with_session(request_fn)) == META["ex"]
+
+
+def test_get_metadata_from_remote_missing_id():
+    async def request_fn(session, url):
+        return await get_metadata_from_remote(session, url, modo_id="nope")
+
+    with pytest.raises(ValueError):
+        run_with_server(with_session(request_fn))
+
+
+def test_get_s3_path():
+    async def request_fn(session, url):
+        return await get_s3_path(session, url, "ex", exact_match=True)
+
+    params = run_with_server(with_session(request_fn))
+    assert params == [{"query": "ex", "exact_match": "True"}]
+
+
+def test_gather_metadata():
+    assert run_with_server(gather_metadata, n_servers=2) == [META, META]
+
+
+def test_invalid_url():
+    async def request_fn(session, url):
+        return await list_remote_items(session, "modos.example.org")
+
+    with pytest.raises(ValueError):
+        run_with_server(with_session(request_fn))
@@ -0,0 +1,10 @@
+"""Tests for the storage backends of multi-omics digital objects (modo)
+"""
+from pathlib import Path
+
+from modos.storage import LocalStorage
+
+
+def test_local_list_missing_target(tmp_path):
+    storage = LocalStorage(tmp_path)
+    assert list(storage.list(Path("missing"))) == []